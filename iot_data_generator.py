@@ -2,9 +2,6 @@
 IoT Data Generator Application
 Generates artificial IoT sensor data with visualization capabilities
 """
-import warnings
-warnings.filterwarnings("ignore", message=".*No wx.App created yet.*")
-
 # GUI Framework
 import wx
 import wx.grid
@@ -13,91 +10,340 @@ import wx.grid
 import pandas as pd
 import numpy as np
 
-# Visualization
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_wxagg import FigureCanvasWxAgg as FigureCanvas
-
 # Data Generation
 from faker import Faker
 
+# Optional fast JSON exporter
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional Zstandard compression for exports
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# numba, pyarrow and polars are heavier, so they are only imported when first needed
+
 # Utilities
 import json
 import csv
-import random
+import gzip
+import io
 import threading
-import time
-from datetime import datetime, timedelta
-from collections import Counter
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+from itertools import chain, repeat
+from bisect import bisect_right
+from collections import Counter, deque
 
 fake = Faker()
 
+# User record columns
+USER_COLUMNS = ['firstname', 'lastname', 'age', 'gender', 'username', 'address', 'email']
+
+# Sensor record columns, stored per user as parallel arrays; 'ts' holds datetime64
+# timestamps that are only formatted into date and time strings for display and export
+NUMERIC_COLUMNS = ['outside_temperature', 'outside_humidity', 'room_temperature', 'room_humidity']
+SENSOR_COLUMNS = ['ts'] + NUMERIC_COLUMNS
+EXPORT_SENSOR_COLUMNS = ['date', 'time'] + NUMERIC_COLUMNS
+
+# Numba kernels, compiled by load_kernels on first generation; they stay None without numba
+_fill_sensors = None
+_seed_sensors = None
+_hist_and_stats = None
+_kernels_loaded = False
+
+def load_kernels():
+    """Import numba and compile the JIT kernels the first time they are needed"""
+    global _fill_sensors, _seed_sensors, _hist_and_stats, _kernels_loaded
+    if _kernels_loaded:
+        return
+    _kernels_loaded = True
+    
+    try:
+        from numba import njit
+    except ImportError:
+        return
+    
+    @njit('void(f4[:], f4[:], f4[:], f4[:], i8)', cache=True)
+    def fill_sensors(out_ot, out_oh, out_rt, out_rh, n):
+        """Fill preallocated sensor arrays in one fused loop"""
+        # Users are already spread over worker processes, so the kernel stays serial
+        for i in range(n):
+            ot = np.random.uniform(70, 95)
+            oh = np.random.uniform(50, 95)
+            out_ot[i] = round(ot, 2)
+            out_oh[i] = round(oh, 2)
+            out_rt[i] = round(ot - np.random.uniform(0, 10), 2)
+            out_rh[i] = round(oh - np.random.uniform(0, 10), 2)
+    
+    @njit('void(i8)', cache=True)
+    def seed_sensors(seed):
+        """Seed Numba's internal generator used by fill_sensors"""
+        np.random.seed(seed)
+    
+    @njit(cache=True)
+    def hist_and_stats(values, edges):
+        """Bin values and accumulate their sum and sum of squares in one pass"""
+        bins = len(edges) - 1
+        counts = np.zeros(bins, dtype=np.int64)
+        lo = edges[0]
+        scale = bins / (edges[-1] - lo)
+        total = 0.0
+        total_sq = 0.0
+        for x in values:
+            idx = min(int((x - lo) * scale), bins - 1)
+            # Same edge correction as np.histogram, so values sitting on a bin edge land identically
+            if x < edges[idx]:
+                idx -= 1
+            elif idx < bins - 1 and x >= edges[idx + 1]:
+                idx += 1
+            counts[idx] += 1
+            total += x
+            total_sq += x * x
+        return counts, total, total_sq
+    
+    _fill_sensors, _seed_sensors, _hist_and_stats = fill_sensors, seed_sensors, hist_and_stats
+
+def import_pyarrow():
+    """Import pyarrow with its CSV and Parquet modules, or return None when it is not installed"""
+    try:
+        import pyarrow
+        import pyarrow.csv
+        import pyarrow.parquet
+    except ImportError:
+        return None
+    return pyarrow
+
 class IoTDataGenerator:
     @staticmethod
-    def generate_user_data(num_users=1000):
+    def generate_user_data(num_users=1000, rng=None):
         """Generate user records"""
+        if rng is None:
+            rng = np.random.default_rng()
+        
+        # Draw ages and genders for all users at once
+        ages = rng.integers(18, 81, num_users).tolist()
+        genders = rng.choice(['Male', 'Female'], num_users).tolist()
+        
         users = []
-        for _ in range(num_users):
-            firstname = fake.first_name()
-            lastname = fake.last_name()
-            age = random.randint(18, 80)
-            gender = random.choice(['Male', 'Female'])
-            username = fake.user_name()
-            address = fake.address().replace('\n', ', ')
-            email = fake.email()
-            
+        for age, gender in zip(ages, genders):
             users.append({
-                'firstname': firstname,
-                'lastname': lastname,
+                'firstname': fake.first_name(),
+                'lastname': fake.last_name(),
                 'age': age,
                 'gender': gender,
-                'username': username,
-                'address': address,
-                'email': email,
-                'sensor_data': []
+                'username': fake.user_name(),
+                'address': fake.address().replace('\n', ', '),
+                'email': fake.email(),
+                'sensor_data': {}
             })
         return users
     
     @staticmethod
-    def generate_sensor_data_for_user(start_date='2015-01-01', num_records=1000):
-        """Generate sensor data for a single user"""
-        sensor_data = []
-        current_date = datetime.strptime(start_date, '%Y-%m-%d')
-        
+    def generate_timestamps(start_date='2015-01-01', num_records=1000):
+        """Generate the datetime64 timestamp array for a sensor series"""
         # Generate data every 6 hours
-        for _ in range(num_records):
-            date_str = current_date.strftime('%Y-%m-%d')
-            time_str = current_date.strftime('%H:%M:%S')
+        return pd.date_range(start_date, periods=num_records, freq='6h').to_numpy()
+    
+    @staticmethod
+    def format_timestamps(timestamps):
+        """Format datetime64 timestamps into date and time string arrays"""
+        index = pd.DatetimeIndex(timestamps)
+        return index.strftime('%Y-%m-%d').to_numpy(), index.strftime('%H:%M:%S').to_numpy()
+    
+    @staticmethod
+    def generate_sensor_readings(num_records=1000, rng=None, out=None):
+        """Generate the temperature and humidity arrays for a sensor series"""
+        if rng is None:
+            rng = np.random.default_rng()
+        
+        # Fill caller-provided float32 columns in place (e.g. slices of the global buffers)
+        if out is None:
+            out = np.empty((len(NUMERIC_COLUMNS), num_records), dtype=np.float32)
+        outside_temp, outside_humidity, room_temp, room_humidity = out
+        
+        if _fill_sensors is not None:
+            # Numba has its own generator; seed it from rng so results follow the seed
+            _seed_sensors(int(rng.integers(2**32)))
             
+            # Fused JIT kernel writes straight into the float32 arrays
+            _fill_sensors(outside_temp, outside_humidity, room_temp, room_humidity, num_records)
+        else:
             # Outside temperature (70-95)
-            outside_temp = random.uniform(70, 95)
+            rng.random(dtype=np.float32, out=outside_temp)
+            outside_temp *= 25
+            outside_temp += 70
             
             # Room temperature (0-10 degrees less than outside)
-            temp_diff = random.uniform(0, 10)
-            room_temp = outside_temp - temp_diff
+            rng.random(dtype=np.float32, out=room_temp)
+            room_temp *= -10
+            room_temp += outside_temp
             
             # Outside humidity (50-95)
-            outside_humidity = random.uniform(50, 95)
+            rng.random(dtype=np.float32, out=outside_humidity)
+            outside_humidity *= 45
+            outside_humidity += 50
             
             # Room humidity (0-10 degrees less than outside)
-            humidity_diff = random.uniform(0, 10)
-            room_humidity = outside_humidity - humidity_diff
-            
-            sensor_data.append({
-                'date': date_str,
-                'time': time_str,
-                'outside_temperature': round(outside_temp, 2),
-                'outside_humidity': round(outside_humidity, 2),
-                'room_temperature': round(room_temp, 2),
-                'room_humidity': round(room_humidity, 2)
-            })
+            rng.random(dtype=np.float32, out=room_humidity)
+            room_humidity *= -10
+            room_humidity += outside_humidity
             
-            # Increment by 6 hours
-            current_date += timedelta(hours=6)
-        
-        return sensor_data
+            # Round in place so the readings never hold float64 copies
+            for readings in (outside_temp, outside_humidity, room_temp, room_humidity):
+                np.round(readings, 2, out=readings)
+        
+        return {
+            'outside_temperature': outside_temp,
+            'outside_humidity': outside_humidity,
+            'room_temperature': room_temp,
+            'room_humidity': room_humidity
+        }
+    
+    @staticmethod
+    def build_sensor_dataframe(timestamps, readings):
+        """Wrap the global sensor buffers in a DataFrame without copying the readings"""
+        # readings is (column, record); its transpose becomes the DataFrame's float32 block as-is
+        num_users = readings.shape[1] // len(timestamps) if len(timestamps) else 0
+        df = pd.DataFrame(readings.T, columns=NUMERIC_COLUMNS, copy=False)
+        df.insert(0, 'ts', np.tile(timestamps, num_users))
+        return df
+    
+    @staticmethod
+    def build_export_table(users, sensor_df, offsets):
+        """Build an Arrow table of the user columns alongside the typed sensor columns"""
+        # Sensor rows are stored user by user, so gather each user's values once per record
+        pa = import_pyarrow()
+        user_index = pa.array(np.repeat(np.arange(len(users), dtype=np.int32), np.diff(offsets)))
+        columns = {col: pa.array([user[col] for user in users]).take(user_index) for col in USER_COLUMNS}
+        
+        # Timestamps and float32 readings go in as-is, without formatting to text
+        columns.update({col: sensor_df[col].to_numpy() for col in SENSOR_COLUMNS})
+        return pa.table(columns)
+    
+    @staticmethod
+    def build_sensor_records(sensor_data, formatted_timestamps=None):
+        """Expand a user's sensor columns into per-record dicts for JSON export"""
+        # Users share one timestamp array, so callers pass a dict to format each array only once
+        if formatted_timestamps is None:
+            formatted_timestamps = {}
+        ts = sensor_data['ts']
+        if id(ts) not in formatted_timestamps:
+            dates, times = IoTDataGenerator.format_timestamps(ts)
+            formatted_timestamps[id(ts)] = (dates.tolist(), times.tolist())
+        dates, times = formatted_timestamps[id(ts)]
+        
+        # Widen the float32 readings to two-decimal floats
+        readings = [np.round(sensor_data[col].astype(np.float64), 2).tolist() for col in NUMERIC_COLUMNS]
+        return [dict(zip(EXPORT_SENSOR_COLUMNS, values)) for values in zip(dates, times, *readings)]
+
+def _gen_user_slab(slab):
+    """Generate a slab of users, writing their readings into shared memory (runs in a worker process)"""
+    seed, count, first_user, num_records, shm_name, total_records = slab
+    
+    # A per-worker generator (and Faker seed) so forked workers never repeat each other's data
+    rng = np.random.default_rng(seed)
+    fake.seed_instance(seed)
+    
+    # Forked workers inherit the parent's kernels; spawned ones load them here
+    load_kernels()
+    
+    users = IoTDataGenerator.generate_user_data(count, rng)
+    
+    # Each user's readings go straight into its own slice of the global buffers
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        buffers = np.ndarray((len(NUMERIC_COLUMNS), total_records), dtype=np.float32, buffer=shm.buf)
+        for i in range(count):
+            start = (first_user + i) * num_records
+            IoTDataGenerator.generate_sensor_readings(num_records, rng,
+                                                      out=buffers[:, start:start + num_records])
+        del buffers
+    finally:
+        shm.close()
+    return users
+
+def open_export_file(pathname):
+    """Open an export file for binary writing, compressed according to its .gz or .zst extension"""
+    if pathname.endswith('.gz'):
+        # Fastest level; the sensor text compresses well even so
+        raw = gzip.open(pathname, 'wb', compresslevel=1)
+    elif pathname.endswith('.zst'):
+        if zstandard is None:
+            raise RuntimeError("Saving .zst files requires the zstandard package.")
+        raw = zstandard.ZstdCompressor().stream_writer(open(pathname, 'wb'))
+    else:
+        raw = open(pathname, 'wb', buffering=0)
+    
+    # A 1 MiB buffer coalesces the many small writes before they reach the compressor or disk
+    return io.BufferedWriter(raw, buffer_size=1 << 20)
+
+def encode_json(obj):
+    """Encode an object as indented JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+def map_bounded(executor, fn, items, max_pending):
+    """Like executor.map, but with at most max_pending items submitted and not yet consumed"""
+    # executor.map submits everything up front, so a slow consumer would let every result pile up
+    pending = deque()
+    for item in items:
+        if len(pending) >= max_pending:
+            yield pending.popleft().result()
+        pending.append(executor.submit(fn, item))
+    while pending:
+        yield pending.popleft().result()
+
+def _encode_json_chunk(users):
+    """Encode a chunk of users as comma-separated JSON objects (runs in a worker process)"""
+    formatted_timestamps = {}
+    return b',\n'.join(
+        encode_json({**user, 'sensor_data': IoTDataGenerator.build_sensor_records(user['sensor_data'],
+                                                                                  formatted_timestamps)})
+        for user in users)
+
+def _encode_csv_chunk(chunk):
+    """Encode a chunk of user and sensor rows as CSV bytes (runs in a worker process)"""
+    user_prefixes, counts, timestamps, readings = chunk
+    
+    # Quote each user's columns once with the csv module, quoting strings but not the age the way
+    # pyarrow's writer does; the rows then only append their sensor text
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, quoting=csv.QUOTE_NONNUMERIC)
+    encoded_prefixes = []
+    for prefix in user_prefixes:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerow(prefix)
+        encoded_prefixes.append(buffer.getvalue()[:-len(writer.dialect.lineterminator)] + ',')
+    
+    # Users share the same timestamps, so format each distinct one once; dates and times never
+    # contain quotes and readings are numeric, so they are joined directly
+    unique_ts, ts_index = np.unique(timestamps, return_inverse=True)
+    unique_dates, unique_times = IoTDataGenerator.format_timestamps(unique_ts)
+    sensor_text = [f'"{date}","{time}"' for date, time in zip(unique_dates, unique_times)]
+    
+    # Whole readings are written without a trailing ".0", as pyarrow's writer does
+    reading_text = []
+    for column in readings:
+        text = column.astype(str)
+        whole = column == np.floor(column)
+        text[whole] = column[whole].astype(np.int64).astype(str)
+        reading_text.append(text)
+    
+    prefixes = chain.from_iterable(map(repeat, encoded_prefixes, counts))
+    rows = zip(prefixes, map(sensor_text.__getitem__, ts_index.tolist()), *reading_text)
+    return ''.join(f"{prefix}{ts},{ot},{oh},{rt},{rh}\r\n" for prefix, ts, ot, oh, rt, rh in rows).encode('utf-8')
 
 class StatisticsDialog(wx.Dialog):
-    def __init__(self, parent, data):
+    def __init__(self, parent, df, sensor_arrays, num_users):
         wx.Dialog.__init__(self, parent, title="Descriptive Statistics", size=(600, 400))
         
         panel = wx.Panel(self)
@@ -113,52 +359,56 @@ class StatisticsDialog(wx.Dialog):
         vbox.Add(close_btn, flag=wx.ALIGN_CENTER | wx.BOTTOM, border=10)
         
         panel.SetSizer(vbox)
-        self.generate_statistics(data)
+        self.generate_statistics(df, sensor_arrays, num_users)
     
-    def generate_statistics(self, data):
-        """Generate descriptive statistics from the data"""
+    def generate_statistics(self, df, sensor_arrays, num_users):
+        """Generate descriptive statistics from the sensor DataFrame"""
         stats_text = "DESCRIPTIVE STATISTICS\n"
         stats_text += "=" * 50 + "\n\n"
         
-        if not data:
+        if df is None:
             stats_text += "No data available. Please generate IoT data first."
             self.text_ctrl.SetValue(stats_text)
             return
         
-        # Extract all sensor data
-        all_sensor_data = []
-        for user in data:
-            all_sensor_data.extend(user['sensor_data'])
-        
-        if not all_sensor_data:
+        if df.empty:
             stats_text += "No sensor data available."
             self.text_ctrl.SetValue(stats_text)
             return
         
-        # Convert to DataFrame for easier analysis
-        df = pd.DataFrame(all_sensor_data)
-        
-        # Statistics for each column
-        columns = ['outside_temperature', 'outside_humidity', 'room_temperature', 'room_humidity']
+        # Statistics for each column, computed together in one describe() call;
+        # polars runs it multithreaded over the same float32 arrays when installed
+        try:
+            import polars as pl
+        except ImportError:
+            pl = None
+        
+        if pl is not None:
+            described = pl.DataFrame({col: sensor_arrays[col] for col in NUMERIC_COLUMNS}).describe(
+                percentiles=(0.25, 0.5, 0.75))
+            summary = {col: dict(zip(described['statistic'], described[col])) for col in NUMERIC_COLUMNS}
+        else:
+            summary = df[NUMERIC_COLUMNS].describe(percentiles=[0.25, 0.5, 0.75])
         
-        for col in columns:
+        for col in NUMERIC_COLUMNS:
+            col_stats = summary[col]
             stats_text += f"\n{col.upper().replace('_', ' ')}:\n"
             stats_text += "-" * 30 + "\n"
-            stats_text += f"Count: {len(df[col]):,}\n"
-            stats_text += f"Mean: {df[col].mean():.2f}\n"
-            stats_text += f"Std Dev: {df[col].std():.2f}\n"
-            stats_text += f"Min: {df[col].min():.2f}\n"
-            stats_text += f"25%: {df[col].quantile(0.25):.2f}\n"
-            stats_text += f"50% (Median): {df[col].median():.2f}\n"
-            stats_text += f"75%: {df[col].quantile(0.75):.2f}\n"
-            stats_text += f"Max: {df[col].max():.2f}\n"
+            stats_text += f"Count: {int(col_stats['count']):,}\n"
+            stats_text += f"Mean: {col_stats['mean']:.2f}\n"
+            stats_text += f"Std Dev: {col_stats['std']:.2f}\n"
+            stats_text += f"Min: {col_stats['min']:.2f}\n"
+            stats_text += f"25%: {col_stats['25%']:.2f}\n"
+            stats_text += f"50% (Median): {col_stats['50%']:.2f}\n"
+            stats_text += f"75%: {col_stats['75%']:.2f}\n"
+            stats_text += f"Max: {col_stats['max']:.2f}\n"
         
         # Additional statistics
         stats_text += "\n\nADDITIONAL STATISTICS\n"
         stats_text += "-" * 50 + "\n"
-        stats_text += f"Total Users: {len(data):,}\n"
-        stats_text += f"Total Sensor Records: {len(all_sensor_data):,}\n"
-        stats_text += f"Date Range: {all_sensor_data[0]['date']} to {all_sensor_data[-1]['date']}\n"
+        stats_text += f"Total Users: {num_users:,}\n"
+        stats_text += f"Total Sensor Records: {len(df):,}\n"
+        stats_text += f"Date Range: {df['ts'].min():%Y-%m-%d} to {df['ts'].max():%Y-%m-%d}\n"
         
         self.text_ctrl.SetValue(stats_text)
     
@@ -166,14 +416,15 @@ class StatisticsDialog(wx.Dialog):
         self.Destroy()
 
 class PlotFrame(wx.Frame):
-    def __init__(self, parent, title, data, plot_type):
+    def __init__(self, parent, title, sensor_arrays, plot_type):
         wx.Frame.__init__(self, parent, title=title, size=(1000, 800))
         
-        self.data = data
+        self.sensor_arrays = sensor_arrays
         self.plot_type = plot_type
         self.plot_ready = False
         self.zoom_level = 1.0  # Current zoom level (1.0 = 100%)
         self.original_figsize = (12, 9)  # Store original figure size
+        self.base_dpi = 100  # Render resolution at 100% zoom
         
         # Create a panel with scrollbars
         panel = wx.Panel(self)
@@ -231,8 +482,12 @@ class PlotFrame(wx.Frame):
         toolbar_panel.SetSizer(toolbar_sizer)
         vbox.Add(toolbar_panel, 0, wx.EXPAND | wx.ALL, 5)
         
+        # matplotlib is imported when the first plot opens, keeping it out of application startup
+        import matplotlib.pyplot as plt
+        from matplotlib.backends.backend_wxagg import FigureCanvasWxAgg as FigureCanvas
+        
         # Create matplotlib figure inside the scrolled window
-        self.figure = plt.figure(figsize=self.original_figsize, dpi=100, constrained_layout=True)
+        self.figure = plt.figure(figsize=self.original_figsize, dpi=self.base_dpi, constrained_layout=True)
         self.canvas = FigureCanvas(self.scrolled_window, -1, self.figure)
         
         # Create sizer for scrolled window
@@ -281,7 +536,7 @@ class PlotFrame(wx.Frame):
             width, height = self.scrolled_window.GetClientSize()
             
             # Calculate DPI based on window size and desired figure size
-            dpi = 100  # Base DPI
+            dpi = self.base_dpi
             
             # Adjust figure size to fit window (with some padding)
             fig_width = width / dpi * 0.95  # 95% of window width
@@ -305,12 +560,17 @@ class PlotFrame(wx.Frame):
             self.zoom_level = 1.0
             
             # Update figure
+            self.figure.set_dpi(self.base_dpi)
             self.figure.set_size_inches(fig_width, fig_height)
             
             # Update constrained_layout parameters for new size
             self.figure.set_constrained_layout_pads(w_pad=0.04, h_pad=0.04, 
                                                    wspace=0.02, hspace=0.1)
             
+            # Shrink the canvas back from any zoomed size
+            self.fit_canvas_to_figure()
+            self.scrolled_window.Scroll(0, 0)
+            
             self.canvas.draw()
             self.zoom_label.SetLabel("100%")
             self.status_text.SetLabel("Plot auto-fitted to window")
@@ -318,6 +578,15 @@ class PlotFrame(wx.Frame):
             # Disable scrolling when auto-fitted
             self.scrolled_window.EnableScrolling(False, False)
     
+    def fit_canvas_to_figure(self):
+        """Resize the canvas and the scrolled area to the figure's pixel size"""
+        pixel_width, pixel_height = self.figure.bbox.size
+        pixel_size = wx.Size(int(pixel_width), int(pixel_height))
+        self.canvas.SetMinSize(pixel_size)
+        self.canvas.SetSize(pixel_size)
+        self.scrolled_window.SetVirtualSize(pixel_size)
+        return pixel_size
+    
     def update_zoom(self):
         """Update zoom level and redraw"""
         if self.plot_ready:
@@ -325,19 +594,13 @@ class PlotFrame(wx.Frame):
             zoom_percent = int(self.zoom_level * 100)
             self.zoom_label.SetLabel(f"{zoom_percent}%")
             
-            # Calculate new figure size based on original
-            new_width = self.original_figsize[0] * self.zoom_level
-            new_height = self.original_figsize[1] * self.zoom_level
-            
-            # Update figure size
-            self.figure.set_size_inches(new_width, new_height)
+            # Scale the render resolution rather than the figure size, so the layout is
+            # kept; the draw below re-renders every artist at the new DPI
+            self.figure.set_dpi(self.base_dpi * self.zoom_level)
             
+            canvas_size = self.fit_canvas_to_figure()
             self.canvas.draw()
             
-            # Update scrolled window virtual size based on canvas size
-            canvas_size = self.canvas.GetSize()
-            self.scrolled_window.SetVirtualSize(canvas_size)
-            
             # Enable scrolling if plot is larger than window
             scroll_width, scroll_height = self.scrolled_window.GetClientSize()
             if canvas_size.width > scroll_width or canvas_size.height > scroll_height:
@@ -414,45 +677,42 @@ class PlotFrame(wx.Frame):
                 wx.MessageBox(f"Error saving plot: {str(e)}", 
                              "Error", wx.OK | wx.ICON_ERROR, self)
     
+    @staticmethod
+    def histogram_stats(values, bins):
+        """Return bin edges, density, mean, std, min and max of values"""
+        vmin, vmax = float(values.min()), float(values.max())
+        lo, hi = vmin, (vmax if vmax > vmin else vmin + 1.0)
+        edges = np.histogram_bin_edges(values, bins=bins, range=(lo, hi))
+        if _hist_and_stats is not None:
+            counts, total, total_sq = _hist_and_stats(values, edges)
+        else:
+            counts, _ = np.histogram(values, bins=edges)
+            total = values.sum(dtype=np.float64)
+            total_sq = np.dot(values.astype(np.float64), values.astype(np.float64))
+        
+        n = len(values)
+        mean = total / n
+        std = np.sqrt(max(total_sq - n * mean * mean, 0.0) / (n - 1)) if n > 1 else 0.0
+        density = counts / (n * np.diff(edges))
+        return edges, density, mean, std, vmin, vmax
+    
     def start_plot_generation(self):
         """Start plot generation"""
-        self.status_text.SetLabel("Extracting data... Please wait.")
+        self.status_text.SetLabel("Generating plot... Please wait.")
         
-        # Use a simpler approach - generate plot directly with wx.Yield to keep UI responsive
+        # Draw after the frame has painted; the data is already a cached DataFrame
         wx.CallLater(50, self.generate_plot_direct)
     
     def generate_plot_direct(self):
-        """Generate plot directly with periodic yields to keep UI responsive"""
+        """Generate plot directly from the cached sensor arrays"""
         try:
-            # Show we're working
-            self.status_text.SetLabel("Extracting sensor data (0%)...")
-            wx.Yield()  # Allow UI updates
-            
-            # Extract all sensor data with periodic updates
-            all_sensor_data = []
-            total_users = len(self.data)
-            
-            for i, user in enumerate(self.data):
-                all_sensor_data.extend(user['sensor_data'])
-                
-                # Update status every 100 users
-                if i % 100 == 0:
-                    percent = int((i / total_users) * 100)
-                    self.status_text.SetLabel(f"Extracting data ({percent}%)...")
-                    wx.Yield()  # Allow UI updates
+            arrays = self.sensor_arrays
+            num_points = len(arrays['outside_temperature'])
             
-            if not all_sensor_data:
+            if num_points == 0:
                 self.status_text.SetLabel("No data available")
                 return
             
-            self.status_text.SetLabel("Creating DataFrame...")
-            wx.Yield()
-            
-            df = pd.DataFrame(all_sensor_data)
-            
-            self.status_text.SetLabel("Generating plot...")
-            wx.Yield()
-            
             # Clear and create plot
             self.figure.clear()
             
@@ -460,18 +720,19 @@ class PlotFrame(wx.Frame):
                 # Plot A: Density plot of outside temperature
                 ax = self.figure.add_subplot(111)
                 
-                ax.hist(df['outside_temperature'], bins=150, density=True, 
+                edges, density, mean, std, lo, hi = self.histogram_stats(
+                    arrays['outside_temperature'], bins=150)
+                ax.bar(edges[:-1], density, width=np.diff(edges), align='edge',
                        edgecolor='black', alpha=0.7, color='blue')
                 ax.set_xlabel('Outside Temperature (°F)', fontsize=12)
                 ax.set_ylabel('Density', fontsize=12)
-                ax.set_title(f'Density Plot of Outside Temperature\n({len(df):,} data points)', 
+                ax.set_title(f'Density Plot of Outside Temperature\n({num_points:,} data points)', 
                            fontsize=14, fontweight='bold')
                 ax.grid(True, alpha=0.3)
                 
-                stats_text = (f"Mean: {df['outside_temperature'].mean():.2f}°F\n"
-                            f"Std Dev: {df['outside_temperature'].std():.2f}°F\n"
-                            f"Range: {df['outside_temperature'].min():.2f} - "
-                            f"{df['outside_temperature'].max():.2f}°F")
+                stats_text = (f"Mean: {mean:.2f}°F\n"
+                            f"Std Dev: {std:.2f}°F\n"
+                            f"Range: {lo:.2f} - {hi:.2f}°F")
                 ax.text(0.02, 0.98, stats_text, transform=ax.transAxes,
                        verticalalignment='top', fontsize=10,
                        bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8))
@@ -480,21 +741,25 @@ class PlotFrame(wx.Frame):
                 # Plot B: Line graph of outside vs room temperature
                 ax = self.figure.add_subplot(111)
                 
-                sample_size = min(500, len(df))
+                sample_size = min(500, num_points)
                 x = range(sample_size)
                 
-                ax.plot(x, df['outside_temperature'].iloc[:sample_size], 
+                # Slice the underlying arrays once and reuse them for the lines and the difference
+                outside_temp = arrays['outside_temperature'][:sample_size]
+                room_temp = arrays['room_temperature'][:sample_size]
+                
+                ax.plot(x, outside_temp, 
                        label='Outside Temperature', linewidth=2, color='red')
-                ax.plot(x, df['room_temperature'].iloc[:sample_size], 
+                ax.plot(x, room_temp, 
                        label='Room Temperature', linewidth=2, color='blue')
                 ax.set_xlabel('Sample Index', fontsize=12)
                 ax.set_ylabel('Temperature (°F)', fontsize=12)
-                ax.set_title(f'Outside vs Room Temperature\n(First {sample_size:,} of {len(df):,} samples)', 
+                ax.set_title(f'Outside vs Room Temperature\n(First {sample_size:,} of {num_points:,} samples)', 
                            fontsize=14, fontweight='bold')
                 ax.legend(fontsize=11, loc='best')
                 ax.grid(True, alpha=0.3)
                 
-                diff = df['outside_temperature'].iloc[:sample_size] - df['room_temperature'].iloc[:sample_size]
+                diff = outside_temp - room_temp
                 diff_text = (f"Average difference: {diff.mean():.2f}°F\n"
                            f"Max difference: {diff.max():.2f}°F")
                 ax.text(0.02, 0.98, diff_text, transform=ax.transAxes,
@@ -520,10 +785,10 @@ class PlotFrame(wx.Frame):
                     axes.append(self.figure.add_subplot(2, 2, i+1))
                 
                 data_list = [
-                    df['outside_temperature'],
-                    df['room_temperature'], 
-                    df['outside_humidity'],
-                    df['room_humidity']
+                    arrays['outside_temperature'],
+                    arrays['room_temperature'], 
+                    arrays['outside_humidity'],
+                    arrays['room_humidity']
                 ]
                 titles = ['Outside Temperature', 'Room Temperature', 
                          'Outside Humidity', 'Room Humidity']
@@ -533,7 +798,8 @@ class PlotFrame(wx.Frame):
                 for idx, (data, title, color, unit) in enumerate(zip(data_list, titles, colors, units)):
                     ax = axes[idx]
                     
-                    ax.hist(data, bins=200, density=True, alpha=0.7, 
+                    edges, density, mean, std, lo, hi = self.histogram_stats(data, bins=200)
+                    ax.bar(edges[:-1], density, width=np.diff(edges), align='edge', alpha=0.7,
                            color=color, edgecolor='black')
                     
                     ax.set_xlabel(f'{title} ({unit})', fontsize=9)
@@ -541,14 +807,14 @@ class PlotFrame(wx.Frame):
                     ax.set_title(f'{title}\nn={len(data):,}', fontsize=10, fontweight='bold')
                     ax.grid(True, alpha=0.3)
                     
-                    stats_text = (f"μ={data.mean():.2f}{unit}\n"
-                                f"σ={data.std():.2f}{unit}\n"
-                                f"Range: {data.min():.1f}-{data.max():.1f}{unit}")
+                    stats_text = (f"μ={mean:.2f}{unit}\n"
+                                f"σ={std:.2f}{unit}\n"
+                                f"Range: {lo:.1f}-{hi:.1f}{unit}")
                     ax.text(0.02, 0.90, stats_text, transform=ax.transAxes,
                            verticalalignment='top', fontsize=9,
                            bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
                 
-                self.figure.suptitle(f'Density Distributions of All Measurements\nTotal: {len(df):,} data points', 
+                self.figure.suptitle(f'Density Distributions of All Measurements\nTotal: {num_points:,} data points', 
                                    fontsize=12, fontweight='bold', y=0.98)
             
             self.canvas.draw()
@@ -563,12 +829,63 @@ class PlotFrame(wx.Frame):
             # Show error in status bar instead of message box
             self.GetParent().SetStatusText(f"Plot error: {str(e)[:100]}")
 
+class SensorGridTable(wx.grid.GridTableBase):
+    """Virtual grid table that reads cells on demand from the users and sensor DataFrame"""
+    COLUMN_LABELS = ['Firstname', 'Lastname', 'Age', 'Gender', 'Username', 'Address', 'Email',
+                     'Date', 'Time', 'Outside Temp', 'Outside Hum', 'Room Temp', 'Room Hum']
+    
+    def __init__(self, users, df, row_offsets):
+        wx.grid.GridTableBase.__init__(self)
+        self.users = users
+        self.timestamps = df['ts'].array
+        self.readings = [df[col].array for col in NUMERIC_COLUMNS]
+        self.num_rows = len(df)
+        
+        # Row at which each user's sensor records start
+        self.row_offsets = row_offsets
+    
+    def GetNumberRows(self):
+        return self.num_rows
+    
+    def GetNumberCols(self):
+        return len(self.COLUMN_LABELS)
+    
+    def GetColLabelValue(self, col):
+        return self.COLUMN_LABELS[col]
+    
+    def IsEmptyCell(self, row, col):
+        return False
+    
+    def GetValue(self, row, col):
+        if col >= len(USER_COLUMNS):
+            field = EXPORT_SENSOR_COLUMNS[col - len(USER_COLUMNS)]
+            if field == 'date':
+                return self.timestamps[row].strftime('%Y-%m-%d')
+            if field == 'time':
+                return self.timestamps[row].strftime('%H:%M:%S')
+            return str(self.readings[NUMERIC_COLUMNS.index(field)][row])
+        
+        # Plain bisect on a list avoids NumPy's per-call overhead for a single scalar lookup
+        user = self.users[bisect_right(self.row_offsets, row) - 1]
+        value = str(user[USER_COLUMNS[col]])
+        if col == USER_COLUMNS.index('address') and len(value) > 50:
+            value = value[:50] + "..."
+        return value
+    
+    def SetValue(self, row, col, value):
+        pass  # Read-only view of the generated data
+
 class MainWindow(wx.Frame):
     def __init__(self):
         wx.Frame.__init__(self, None, title="IoT Data Generator", size=(1000, 700))
         
         self.data = None
+        self.df = None
+        self.sensor_arrays = None
+        self.total_sensor_count = 0
+        self.record_offsets = None
         self.generation_in_progress = False
+        self.save_in_progress = False
         self.current_plot_frame = None
         
         # Create menu bar
@@ -579,6 +896,7 @@ class MainWindow(wx.Frame):
         generate_item = file_menu.Append(wx.ID_ANY, 'Generate IoT Data', 'Generate artificial IoT data')
         save_json_item = file_menu.Append(wx.ID_ANY, 'Save as JSON', 'Save data as JSON file')
         save_csv_item = file_menu.Append(wx.ID_ANY, 'Save as CSV', 'Save data as CSV file')
+        save_parquet_item = file_menu.Append(wx.ID_ANY, 'Save as Parquet', 'Save data as Parquet file')
         file_menu.AppendSeparator()
         exit_item = file_menu.Append(wx.ID_EXIT, 'Exit', 'Exit application')
         
@@ -597,6 +915,11 @@ class MainWindow(wx.Frame):
         self.Bind(wx.EVT_MENU, self.on_generate, generate_item)
         self.Bind(wx.EVT_MENU, self.on_save_json, save_json_item)
         self.Bind(wx.EVT_MENU, self.on_save_csv, save_csv_item)
+        self.Bind(wx.EVT_MENU, self.on_save_parquet, save_parquet_item)
+        
+        # Menu items that must not run while data is being generated or saved
+        self.generate_item = generate_item
+        self.save_items = [save_json_item, save_csv_item, save_parquet_item]
         self.Bind(wx.EVT_MENU, self.on_exit, exit_item)
         self.Bind(wx.EVT_MENU, self.on_descriptive, descriptive_item)
         self.Bind(wx.EVT_MENU, self.on_plot_a, plot_a_item)
@@ -630,17 +953,11 @@ class MainWindow(wx.Frame):
         self.info_panel.SetSizer(info_sizer)
         vbox.Add(self.info_panel, flag=wx.EXPAND | wx.ALL, border=10)
         
-        # Preview grid (initially hidden)
+        # Data grid (initially hidden), backed by a SensorGridTable once data exists
         self.grid = wx.grid.Grid(panel)
-        self.grid.CreateGrid(0, 13)  # 13 columns for all data
+        self.grid_table = None
         self.grid.Hide()
         
-        # Set column labels
-        columns = ['Firstname', 'Lastname', 'Age', 'Gender', 'Username', 'Address', 'Email',
-                  'Date', 'Time', 'Outside Temp', 'Outside Hum', 'Room Temp', 'Room Hum']
-        for i, col in enumerate(columns):
-            self.grid.SetColLabelValue(i, col)
-        
         vbox.Add(self.grid, proportion=1, flag=wx.EXPAND | wx.ALL, border=10)
         
         panel.SetSizer(vbox)
@@ -658,6 +975,10 @@ class MainWindow(wx.Frame):
             wx.MessageBox("Data generation is already in progress!", "Warning", wx.OK | wx.ICON_WARNING)
             return
         
+        if self.save_in_progress:
+            wx.MessageBox("Data is being saved. Please wait for the save to finish.", "Warning", wx.OK | wx.ICON_WARNING)
+            return
+        
         # Close any open plot windows
         if self.current_plot_frame:
             self.current_plot_frame.Close()
@@ -678,6 +999,7 @@ class MainWindow(wx.Frame):
             
             # Disable menu items during generation
             self.GetMenuBar().EnableTop(1, False)  # Disable Statistics menu
+            self.enable_save_items(False)
             
             thread = threading.Thread(target=self.generate_data_thread)
             thread.daemon = True
@@ -686,26 +1008,78 @@ class MainWindow(wx.Frame):
         dlg.Destroy()
     
     def generate_data_thread(self):
-        """Generate data in a separate thread"""
+        """Generate data in a separate thread, fanning the users out to worker processes"""
         try:
-            wx.CallAfter(self.progress_label.SetLabel, "Generating 1000 user records...")
-            # Generate user data
-            self.data = IoTDataGenerator.generate_user_data(1000)
-            wx.CallAfter(self.progress_label.SetLabel, "1000 user records created. Generating sensor data...")
-            
-            # Generate sensor data for each user
-            total_users = len(self.data)
-            for i, user in enumerate(self.data):
-                user['sensor_data'] = IoTDataGenerator.generate_sensor_data_for_user()
+            num_users = 1000
+            num_records = 1000
+            slab_size = 50
+            total_records = num_users * num_records
+            wx.CallAfter(self.progress_label.SetLabel, f"Generating {num_users} user records with sensor data...")
+            
+            # Compile the Numba kernels before forking, so every worker starts with them
+            load_kernels()
+            
+            # Split the users into slabs, each generated with its own seed
+            starts = list(range(0, num_users, slab_size))
+            counts = [min(slab_size, num_users - start) for start in starts]
+            seeds = [int(seq.generate_state(1)[0]) for seq in np.random.SeedSequence().spawn(len(counts))]
+            
+            # One buffer per sensor column for all users, shared with the workers
+            # so each slab writes its readings in place instead of sending them back
+            shm = shared_memory.SharedMemory(create=True, size=len(NUMERIC_COLUMNS) * total_records * 4)
+            try:
+                slabs = [None] * len(counts)
+                done_users = 0
                 
-                # Update progress every 10 users (more frequent updates)
-                if i % 10 == 0:
-                    progress = f"Generated sensor data for {i}/{total_users} users..."
-                    wx.CallAfter(self.update_progress, progress)
+                # Post progress at most once per 1% of users so the UI queue is never flooded
+                num_users_text = f"{num_users:,}"
+                progress_step = max(1, num_users // 100)
+                next_progress = progress_step
+                with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                    futures = {executor.submit(_gen_user_slab, (seed, count, start, num_records,
+                                                                shm.name, total_records)): i
+                               for i, (seed, count, start) in enumerate(zip(seeds, counts, starts))}
+                    
+                    for future in as_completed(futures):
+                        slab_index = futures[future]
+                        slabs[slab_index] = future.result()
+                        done_users += counts[slab_index]
+                        
+                        if done_users >= next_progress:
+                            next_progress = done_users + progress_step
+                            progress = f"Generated sensor data for {done_users:,}/{num_users_text} users..."
+                            wx.CallAfter(self.update_progress, progress)
                 
-                # Small delay to allow UI updates
-                if i % 50 == 0:
-                    time.sleep(0.01)
+                # Take one private copy so the shared block can be released right away
+                readings = np.ndarray((len(NUMERIC_COLUMNS), total_records), dtype=np.float32,
+                                      buffer=shm.buf).copy()
+            finally:
+                shm.close()
+                shm.unlink()
+            
+            # Keep users in slab order regardless of completion order
+            users = list(chain.from_iterable(slabs))
+            
+            # Every user shares the same 6-hour cadence, so build the timestamps
+            # once; the readings are views into the global buffers
+            timestamps = IoTDataGenerator.generate_timestamps(num_records=num_records)
+            for i, user in enumerate(users):
+                start = i * num_records
+                user['sensor_data'] = {'ts': timestamps,
+                                       **dict(zip(NUMERIC_COLUMNS, readings[:, start:start + num_records]))}
+            
+            # Build the analysis DataFrame once; statistics and plots all read from it
+            wx.CallAfter(self.update_progress, "Building analysis table...")
+            self.df = IoTDataGenerator.build_sensor_dataframe(timestamps, readings)
+            
+            # Statistics and plots work on plain NumPy views of the DataFrame's columns
+            self.sensor_arrays = {col: self.df[col].to_numpy() for col in NUMERIC_COLUMNS}
+            self.data = users
+            self.total_sensor_count = total_records
+            
+            # Row at which each user's records start in the sensor table, plus the total;
+            # the grid and the exports share these instead of recounting every user
+            self.record_offsets = list(range(0, total_records + 1, num_records))
             
             # Update UI on main thread
             wx.CallAfter(self.data_generation_complete)
@@ -725,9 +1099,10 @@ class MainWindow(wx.Frame):
         
         # Re-enable menu items
         self.GetMenuBar().EnableTop(1, True)  # Enable Statistics menu
+        self.enable_save_items(True)
         
         # Update data info
-        total_sensors = sum(len(user['sensor_data']) for user in self.data)
+        total_sensors = self.total_sensor_count
         self.data_info.SetLabel(f"Generated {len(self.data):,} user records with {total_sensors:,} total sensor records")
         
         # Show preview of first few records
@@ -744,51 +1119,33 @@ class MainWindow(wx.Frame):
         
         # Re-enable menu items
         self.GetMenuBar().EnableTop(1, True)  # Enable Statistics menu
+        self.enable_save_items(True)
         
         wx.MessageBox(f"Error generating data: {error_msg}", 
                      "Error", wx.OK | wx.ICON_ERROR)
     
     def show_data_preview(self):
-        """Show a preview of the data in the grid"""
+        """Show the data in the grid through a virtual table"""
         if not self.data or len(self.data) == 0:
             return
         
-        # Clear existing grid
-        if self.grid.GetNumberRows() > 0:
-            self.grid.DeleteRows(0, self.grid.GetNumberRows())
-        
-        # Add first few records for preview
-        preview_count = min(10, len(self.data))
-        row = 0
-        
-        for i in range(preview_count):
-            user = self.data[i]
-            if user['sensor_data']:
-                sensor = user['sensor_data'][0]  # First sensor record
-                
-                self.grid.AppendRows(1)
-                
-                # User data
-                self.grid.SetCellValue(row, 0, user['firstname'])
-                self.grid.SetCellValue(row, 1, user['lastname'])
-                self.grid.SetCellValue(row, 2, str(user['age']))
-                self.grid.SetCellValue(row, 3, user['gender'])
-                self.grid.SetCellValue(row, 4, user['username'])
-                self.grid.SetCellValue(row, 5, user['address'][:50] + "..." if len(user['address']) > 50 else user['address'])
-                self.grid.SetCellValue(row, 6, user['email'])
-                
-                # Sensor data
-                self.grid.SetCellValue(row, 7, sensor['date'])
-                self.grid.SetCellValue(row, 8, sensor['time'])
-                self.grid.SetCellValue(row, 9, str(sensor['outside_temperature']))
-                self.grid.SetCellValue(row, 10, str(sensor['outside_humidity']))
-                self.grid.SetCellValue(row, 11, str(sensor['room_temperature']))
-                self.grid.SetCellValue(row, 12, str(sensor['room_humidity']))
-                
-                row += 1
+        # Batch the table swap and column sizing so the grid repaints once at the end
+        self.grid.BeginBatch()
+        try:
+            # The grid pulls cell values from the table only for the rows on screen
+            self.grid_table = SensorGridTable(self.data, self.df, self.record_offsets)
+            self.grid.SetTable(self.grid_table, True)
+            
+            # AutoSizeColumns would read every row, so size the columns from the first rows only
+            sample_rows = min(100, self.grid_table.GetNumberRows())
+            for col in range(self.grid_table.GetNumberCols()):
+                texts = [self.grid_table.GetColLabelValue(col)]
+                texts.extend(self.grid_table.GetValue(row, col) for row in range(sample_rows))
+                width = max(self.grid.GetTextExtent(text)[0] for text in texts)
+                self.grid.SetColSize(col, width + 16)
+        finally:
+            self.grid.EndBatch()
         
-        # Auto-size columns
-        self.grid.AutoSizeColumns()
         self.grid.Show()
         self.Layout()
     
@@ -798,29 +1155,40 @@ class MainWindow(wx.Frame):
             wx.MessageBox("No data to save. Please generate data first.", "Error", wx.OK | wx.ICON_ERROR)
             return
         
-        with wx.FileDialog(self, "Save JSON file", wildcard="JSON files (*.json)|*.json",
+        with wx.FileDialog(self, "Save JSON file", wildcard=("JSON files (*.json)|*.json|"
+                                                             "Gzip JSON files (*.json.gz)|*.json.gz|"
+                                                             "Zstandard JSON files (*.json.zst)|*.json.zst"),
                           style=wx.FD_SAVE | wx.FD_OVERWRITE_PROMPT) as fileDialog:
             
             if fileDialog.ShowModal() == wx.ID_CANCEL:
                 return
             
-            pathname = fileDialog.GetPath()
+            self.start_save_thread(self.save_json_thread, fileDialog.GetPath())
+    
+    def save_json_thread(self, pathname, users, df, offsets):
+        """Write the JSON file in a separate thread"""
+        try:
+            chunk_size = 50
+            chunks = [users[start:start + chunk_size] for start in range(0, len(users), chunk_size)]
             
-            try:
-                # Convert data to JSON-serializable format
-                json_data = []
-                for user in self.data:
-                    user_copy = user.copy()
-                    json_data.append(user_copy)
-                
-                with open(pathname, 'w') as f:
-                    json.dump(json_data, f, indent=2)
-                
-                wx.MessageBox(f"Data saved to {pathname}", "Success", wx.OK | wx.ICON_INFORMATION)
-                self.SetStatusText(f"Data saved to {pathname}")
-                
-            except Exception as e:
-                wx.MessageBox(f"Error saving file: {str(e)}", "Error", wx.OK | wx.ICON_ERROR)
+            # Worker processes encode chunks of users; they come back in order and are
+            # streamed into the file, with only a bounded number of chunks in flight
+            with open_export_file(pathname) as f, ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                f.write(b'[\n')
+                encoded_chunks = map_bounded(executor, _encode_json_chunk, chunks, 2 * os.cpu_count())
+                for i, encoded in enumerate(encoded_chunks):
+                    if i:
+                        f.write(b',\n')
+                    f.write(encoded)
+                    
+                    done_users = min((i + 1) * chunk_size, len(users))
+                    wx.CallAfter(self.SetStatusText, f"Saving JSON... {done_users:,}/{len(users):,} users")
+                f.write(b'\n]\n')
+            
+            wx.CallAfter(self.save_complete, pathname, len(df))
+            
+        except Exception as e:
+            wx.CallAfter(self.save_error, str(e))
     
     def on_save_csv(self, event):
         """Save data as CSV file"""
@@ -828,65 +1196,164 @@ class MainWindow(wx.Frame):
             wx.MessageBox("No data to save. Please generate data first.", "Error", wx.OK | wx.ICON_ERROR)
             return
         
-        with wx.FileDialog(self, "Save CSV file", wildcard="CSV files (*.csv)|*.csv",
+        with wx.FileDialog(self, "Save CSV file", wildcard=("CSV files (*.csv)|*.csv|"
+                                                            "Gzip CSV files (*.csv.gz)|*.csv.gz|"
+                                                            "Zstandard CSV files (*.csv.zst)|*.csv.zst"),
                           style=wx.FD_SAVE | wx.FD_OVERWRITE_PROMPT) as fileDialog:
             
             if fileDialog.ShowModal() == wx.ID_CANCEL:
                 return
             
-            pathname = fileDialog.GetPath()
+            self.start_save_thread(self.save_csv_thread, fileDialog.GetPath())
+    
+    def save_csv_thread(self, pathname, users, df, offsets):
+        """Write the CSV file in a separate thread"""
+        try:
+            if import_pyarrow() is not None:
+                record_count = self.write_arrow_csv(pathname, users, df, offsets)
+            else:
+                record_count = self.write_csv_rows(pathname, users, df, offsets)
             
-            try:
-                # Prepare data for CSV
-                csv_data = []
-                headers = ['firstname', 'lastname', 'age', 'gender', 'username', 'address', 'email',
-                          'date', 'time', 'outside_temperature', 'outside_humidity', 
-                          'room_temperature', 'room_humidity']
-                
-                # Add headers
-                csv_data.append(headers)
-                
-                # Add data (first 10000 records for performance)
-                record_count = 0
-                max_records = 10000
-                
-                for user in self.data:
-                    for sensor in user['sensor_data']:
-                        row = [
-                            user['firstname'],
-                            user['lastname'],
-                            str(user['age']),
-                            user['gender'],
-                            user['username'],
-                            user['address'],
-                            user['email'],
-                            sensor['date'],
-                            sensor['time'],
-                            str(sensor['outside_temperature']),
-                            str(sensor['outside_humidity']),
-                            str(sensor['room_temperature']),
-                            str(sensor['room_humidity'])
-                        ]
-                        csv_data.append(row)
-                        
-                        record_count += 1
-                        if record_count >= max_records:
-                            break
-                    
-                    if record_count >= max_records:
-                        break
+            wx.CallAfter(self.save_complete, pathname, record_count)
+            
+        except Exception as e:
+            wx.CallAfter(self.save_error, str(e))
+    
+    def on_save_parquet(self, event):
+        """Save data as Parquet file"""
+        if not self.data:
+            wx.MessageBox("No data to save. Please generate data first.", "Error", wx.OK | wx.ICON_ERROR)
+            return
+        
+        if import_pyarrow() is None:
+            wx.MessageBox("Saving as Parquet requires the pyarrow package.", "Error", wx.OK | wx.ICON_ERROR)
+            return
+        
+        with wx.FileDialog(self, "Save Parquet file", wildcard="Parquet files (*.parquet)|*.parquet",
+                          style=wx.FD_SAVE | wx.FD_OVERWRITE_PROMPT) as fileDialog:
+            
+            if fileDialog.ShowModal() == wx.ID_CANCEL:
+                return
+            
+            self.start_save_thread(self.save_parquet_thread, fileDialog.GetPath())
+    
+    def save_parquet_thread(self, pathname, users, df, offsets):
+        """Write the Parquet file in a separate thread"""
+        try:
+            # Columnar and compressed, so every record is written
+            table = IoTDataGenerator.build_export_table(users, df, offsets)
+            import_pyarrow().parquet.write_table(table, pathname, compression='zstd')
+            
+            wx.CallAfter(self.save_complete, pathname, table.num_rows)
+            
+        except Exception as e:
+            wx.CallAfter(self.save_error, str(e))
+    
+    def start_save_thread(self, target, pathname):
+        """Run an export in a separate thread so the window stays responsive"""
+        # Only one save at a time, and no regeneration underneath it
+        self.save_in_progress = True
+        self.generate_item.Enable(False)
+        self.enable_save_items(False)
+        self.SetStatusText(f"Saving {pathname}...")
+        
+        # Hand the thread the users, sensor table and offsets together so it never sees a mix of two generations
+        thread = threading.Thread(target=target, args=(pathname, self.data, self.df, self.record_offsets))
+        thread.daemon = True
+        thread.start()
+    
+    def end_save(self):
+        """Re-enable generation and saving once an export is done"""
+        self.save_in_progress = False
+        self.generate_item.Enable(True)
+        self.enable_save_items(True)
+    
+    def enable_save_items(self, enable):
+        """Enable or disable the Save menu items"""
+        for item in self.save_items:
+            item.Enable(enable)
+    
+    def save_complete(self, pathname, record_count):
+        """Called when an export finishes with the number of records written"""
+        self.end_save()
+        self.SetStatusText(f"Data saved to {pathname}")
+        wx.MessageBox(f"Data saved to {pathname}\nSaved {record_count:,} records.",
+                     "Success", wx.OK | wx.ICON_INFORMATION)
+    
+    def save_error(self, error_msg):
+        """Called when an export fails"""
+        self.end_save()
+        self.SetStatusText("Saving data failed")
+        wx.MessageBox(f"Error saving file: {error_msg}", "Error", wx.OK | wx.ICON_ERROR)
+    
+    def write_csv_rows(self, pathname, users, df, offsets):
+        """Write every record with the csv module and return how many were written"""
+        timestamps = df['ts'].to_numpy()
+        readings = [df[col].to_numpy() for col in NUMERIC_COLUMNS]
+        counts = np.diff(offsets).tolist()
+        
+        # Cut the rows into chunks of whole users, each carrying its slice of the sensor columns
+        chunk_size = 50
+        chunks = []
+        for start in range(0, len(users), chunk_size):
+            stop = min(start + chunk_size, len(users))
+            first, last = offsets[start], offsets[stop]
+            user_prefixes = [(user['firstname'], user['lastname'], user['age'], user['gender'],
+                              user['username'], user['address'], user['email'])
+                             for user in users[start:stop]]
+            chunks.append((user_prefixes, counts[start:stop], timestamps[first:last],
+                           [column[first:last] for column in readings]))
+        
+        # Worker processes encode the chunks; they come back in order and are streamed into the
+        # file, with only a bounded number of chunks in flight
+        with open_export_file(pathname) as f, ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            f.write((','.join(USER_COLUMNS + EXPORT_SENSOR_COLUMNS) + '\r\n').encode('utf-8'))
+            encoded_chunks = map_bounded(executor, _encode_csv_chunk, chunks, 2 * os.cpu_count())
+            for i, encoded in enumerate(encoded_chunks):
+                f.write(encoded)
                 
-                # Write to CSV
-                with open(pathname, 'w', newline='', encoding='utf-8') as f:
-                    writer = csv.writer(f)
-                    writer.writerows(csv_data)
+                done = offsets[min((i + 1) * chunk_size, len(users))]
+                wx.CallAfter(self.SetStatusText, f"Saving CSV... {done:,}/{offsets[-1]:,} records")
+        
+        return offsets[-1]
+    
+    def write_arrow_csv(self, pathname, users, df, offsets):
+        """Write every record with pyarrow's CSV writer and return how many were written"""
+        pa = import_pyarrow()
+        counts = np.diff(offsets).tolist()
+        user_columns = {col: pa.array([user[col] for user in users]) for col in USER_COLUMNS}
+        readings = [df[col].to_numpy() for col in NUMERIC_COLUMNS]
+        
+        # Users share the same timestamps, so format each distinct one once and gather the text per row
+        unique_ts, ts_index = np.unique(df['ts'].to_numpy(), return_inverse=True)
+        unique_dates, unique_times = IoTDataGenerator.format_timestamps(unique_ts)
+        unique_dates, unique_times = pa.array(unique_dates), pa.array(unique_times)
+        ts_index = ts_index.astype(np.int32)
+        
+        schema = pa.schema([(col, user_columns[col].type) for col in USER_COLUMNS] +
+                           [('date', pa.string()), ('time', pa.string())] +
+                           [(col, pa.float32()) for col in NUMERIC_COLUMNS])
+        
+        # Quote and end lines the same way as the csv module fallback
+        write_options = pa.csv.WriteOptions(quoting_style='needed', quoting_header='none', eol='\r\n')
+        
+        # Build and write one small table per chunk of whole users, so memory stays flat
+        chunk_size = 50
+        with open_export_file(pathname) as f, pa.csv.CSVWriter(f, schema, write_options=write_options) as writer:
+            for start in range(0, len(users), chunk_size):
+                stop = min(start + chunk_size, len(users))
+                first, last = offsets[start], offsets[stop]
                 
-                wx.MessageBox(f"Data saved to {pathname}\nSaved {record_count} records.", 
-                             "Success", wx.OK | wx.ICON_INFORMATION)
-                self.SetStatusText(f"Data saved to {pathname}")
+                user_index = pa.array(np.repeat(np.arange(start, stop, dtype=np.int32), counts[start:stop]))
+                row_ts = pa.array(ts_index[first:last])
+                columns = [user_columns[col].take(user_index) for col in USER_COLUMNS]
+                columns += [unique_dates.take(row_ts), unique_times.take(row_ts)]
+                columns += [column[first:last] for column in readings]
+                writer.write_table(pa.table(columns, schema=schema))
                 
-            except Exception as e:
-                wx.MessageBox(f"Error saving file: {str(e)}", "Error", wx.OK | wx.ICON_ERROR)
+                wx.CallAfter(self.SetStatusText, f"Saving CSV... {last:,}/{offsets[-1]:,} records")
+        
+        return offsets[-1]
     
     def on_descriptive(self, event):
         """Show descriptive statistics dialog"""
@@ -894,7 +1361,7 @@ class MainWindow(wx.Frame):
             wx.MessageBox("No data available. Please generate data first.", "Error", wx.OK | wx.ICON_ERROR)
             return
         
-        dlg = StatisticsDialog(self, self.data)
+        dlg = StatisticsDialog(self, self.df, self.sensor_arrays, len(self.data))
         dlg.ShowModal()
         dlg.Destroy()
     
@@ -908,7 +1375,7 @@ class MainWindow(wx.Frame):
         if self.current_plot_frame:
             self.current_plot_frame.Close()
         
-        self.current_plot_frame = PlotFrame(self, "Plot A - Outside Temperature Density", self.data, 'A')
+        self.current_plot_frame = PlotFrame(self, "Plot A - Outside Temperature Density", self.sensor_arrays, 'A')
         self.current_plot_frame.Show()
     
     def on_plot_b(self, event):
@@ -921,7 +1388,7 @@ class MainWindow(wx.Frame):
         if self.current_plot_frame:
             self.current_plot_frame.Close()
         
-        self.current_plot_frame = PlotFrame(self, "Plot B - Temperature Comparison", self.data, 'B')
+        self.current_plot_frame = PlotFrame(self, "Plot B - Temperature Comparison", self.sensor_arrays, 'B')
         self.current_plot_frame.Show()
     
     def on_plot_c(self, event):
@@ -934,7 +1401,7 @@ class MainWindow(wx.Frame):
         if self.current_plot_frame:
             self.current_plot_frame.Close()
         
-        self.current_plot_frame = PlotFrame(self, "Plot C - All Measurements Density", self.data, 'C')
+        self.current_plot_frame = PlotFrame(self, "Plot C - All Measurements Density", self.sensor_arrays, 'C')
         self.current_plot_frame.Show()
     
     def on_exit(self, event):
@@ -943,16 +1410,19 @@ class MainWindow(wx.Frame):
 
 # Fix matplotlib cleanup issue with wxPython
 import atexit
-import matplotlib._pylab_helpers
 
 @atexit.register
 def cleanup_matplotlib():
     """Clean up matplotlib figures without causing wxPython errors"""
-    for manager in list(matplotlib._pylab_helpers.Gcf._activeQue.values()):
-        try:
-            manager.destroy()
-        except:
-            pass
+    # Nothing to close if no plot was ever opened
+    plt = sys.modules.get('matplotlib.pyplot')
+    if plt is None:
+        return
+    
+    try:
+        plt.close('all')
+    except Exception:
+        pass
 
 def main():
     app = wx.App(False)